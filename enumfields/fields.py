@@ -1,3 +1,4 @@
+import weakref
 from enum import Enum
 
 from django.core import checks
@@ -10,24 +11,48 @@ from django.utils.module_loading import import_string
 from .forms import EnumChoiceField
 
 
+# Only labels are cached: members reference their enum class, which would keep the weak keys alive.
+_LABELS_CACHE = weakref.WeakKeyDictionary()
+
+
+def _get_enum_choices(enum):
+    """
+    Return the (member, label) choices of `enum`; labels are computed once per enum class.
+    """
+    try:
+        labels = _LABELS_CACHE[enum]
+    except KeyError:
+        labels = _LABELS_CACHE[enum] = tuple(getattr(i, 'label', i.name) for i in enum)
+    return list(zip(enum, labels))
+
+
 class CastOnAssignDescriptor:
     """
-    A property descriptor which ensures that `field.to_python()` is called on _every_ assignment to the field.
+    A property descriptor which ensures that `field.to_python()` is called on assignment to the field.
+
+    As a fast path, `None` and members of the field's enum are stored as-is without calling `field.to_python()`,
+    so overrides of `to_python()` only see other values.
 
     This used to be provided by the `django.db.models.subclassing.Creator` class, which in turn
     was used by the deprecated-in-Django-1.10 `SubfieldBase` class, hence the reimplementation here.
     """
 
+    __slots__ = ('field', '_enum', '_name')
+
     def __init__(self, field):
         self.field = field
+        self._enum = field.enum
+        self._name = field.name
 
     def __get__(self, obj, type=None):
         if obj is None:
             return self
-        return obj.__dict__[self.field.name]
+        return obj.__dict__[self._name]
 
     def __set__(self, obj, value):
-        obj.__dict__[self.field.name] = self.field.to_python(value)
+        if value is not None and type(value) is not self._enum:
+            value = self.field.to_python(value)
+        obj.__dict__[self._name] = value
 
 
 class EnumFieldMixin:
@@ -36,37 +61,59 @@ class EnumFieldMixin:
             self.enum = import_string(enum)
         else:
             self.enum = enum
+        self._value2member_map = self.enum._value2member_map_
 
         if "choices" not in options:
-            options["choices"] = [  # choices for the TypedChoiceField
-                (i, getattr(i, 'label', i.name))
-                for i in self.enum
-            ]
+            options["choices"] = _get_enum_choices(self.enum)  # choices for the TypedChoiceField
 
         super().__init__(**options)
 
+    @cached_property
+    def _str_value_lookup(self):
+        # Maps the string forms of member values to members; the first member in declaration order wins.
+        # Labels are not included, since they may be lazy translations that depend on the active language.
+        lookup = {}
+        for m in self.enum:
+            lookup.setdefault(str(m.value), m)
+        return lookup
+
+    def _lookup_member(self, value):
+        try:
+            return self._value2member_map.get(value)
+        except TypeError:  # unhashable value
+            return None
+
     def contribute_to_class(self, cls, name):
         super().contribute_to_class(cls, name)
         setattr(cls, name, CastOnAssignDescriptor(self))
 
     def to_python(self, value):
-        if value is None or value == '':
+        if value is None:
             return None
-        if isinstance(value, self.enum):
+        enum = self.enum
+        if type(value) is enum:
             return value
-        for m in self.enum:
-            if value == m:
-                return m
-            if value == m.value or str(value) == str(m.value) or str(value) == str(m):
-                return m
-        raise ValidationError('{} is not a valid value for enum {}'.format(value, self.enum), code="invalid_enum_value")
+        if value == '':
+            return None
+        member = self._lookup_member(value)
+        if member is None:
+            str_value = str(value)
+            member = self._str_value_lookup.get(str_value)
+            if member is None:
+                member = next((m for m in enum if str(m) == str_value), None)
+        if member is not None:
+            return member
+        raise ValidationError('{} is not a valid value for enum {}'.format(value, enum), code="invalid_enum_value")
 
     def get_prep_value(self, value):
         if value is None:
             return None
-        if isinstance(value, self.enum):  # Already the correct type -- fast path
+        if type(value) is self.enum:  # Already the correct type -- fast path
             return value.value
-        return self.enum(value).value
+        member = self._lookup_member(value)
+        if member is None:
+            member = self.enum(value)
+        return member.value
 
     def from_db_value(self, value, expression, connection, *args):
         return self.to_python(value)
@@ -137,9 +184,10 @@ class EnumField(EnumFieldMixin, models.CharField):
 
     def _check_max_length_fit(self, **kwargs):
         if isinstance(self.max_length, int):
-            unfit_values = [e for e in self.enum if len(str(e.value)) > self.max_length]
+            value_lengths = [(e, len(str(e.value))) for e in self.enum]
+            unfit_values = [e for e, length in value_lengths if length > self.max_length]
             if unfit_values:
-                fit_max_length = max([len(str(e.value)) for e in self.enum])
+                fit_max_length = max(length for _, length in value_lengths)
                 message = (
                     "Values {unfit_values} of {enum} won't fit in "
                     "the backing CharField (max_length={max_length})."
@@ -1,4 +1,4 @@
-from django.utils.translation import ugettext_lazy
+from django.utils.translation import gettext_lazy, ugettext_lazy
 
 from enumfields import Enum, IntEnum
 
@@ -46,3 +46,12 @@ class LabeledEnum(Enum):
         BAR = 'Bar'
         # this is intentional. see test_nonunique_label
         FOOBAR = 'Foo'
+
+
+class YesNo(Enum):
+    YES = 'y'
+    NO = 'n'
+
+    class Labels:
+        YES = gettext_lazy('Yes')
+        NO = gettext_lazy('No')
@@ -1,8 +1,16 @@
+import gc
+import weakref
+from unittest import mock
+
+from django.core.exceptions import ValidationError
 from django.db import connection
+from django.utils import translation
 
 import pytest
 
-from .enums import Color, IntegerEnum, LabeledEnum, Taste, ZeroEnum
+from enumfields import Enum, EnumField
+
+from .enums import Color, IntegerEnum, LabeledEnum, Taste, YesNo, ZeroEnum
 from .models import MyModel
 
 
@@ -28,6 +36,23 @@ def test_descriptor():
     assert MyModel.color.field.enum is Color
 
 
+def test_descriptor_assignment():
+    m = MyModel()
+    field = MyModel._meta.get_field('color')
+    with mock.patch.object(field, 'to_python', wraps=field.to_python) as to_python:
+        m.color = Color.GREEN
+        assert m.__dict__['color'] is Color.GREEN
+        m.color = None
+        assert m.__dict__['color'] is None
+        assert not to_python.called
+
+        m.color = 'r'
+        assert m.color is Color.RED
+        to_python.assert_called_once_with('r')
+    m.taste_int = '2'
+    assert m.taste_int is Taste.SOUR
+
+
 @pytest.mark.django_db
 def test_db_value():
     m = MyModel(color=Color.RED)
@@ -105,3 +130,72 @@ def test_nonunique_label():
 
     obj = MyModel.objects.get(pk=obj.pk)
     assert obj.labeled_enum is LabeledEnum.FOOBAR
+
+
+def test_to_python_lookup():
+    field = MyModel._meta.get_field('color')
+    assert field.to_python('r') is Color.RED
+    assert field.to_python('Reddish') is Color.RED
+    assert field.to_python('bluë') is Color.BLUE
+    with pytest.raises(ValidationError):
+        field.to_python('xx')
+    with pytest.raises(ValidationError):
+        field.to_python(['r'])
+
+    field = MyModel._meta.get_field('taste_int')
+    assert field.to_python(1) is Taste.SWEET
+    assert field.to_python('1') is Taste.SWEET
+    assert field.to_python('Sweet') is Taste.SWEET
+
+    # An exact value match wins over a string-coerced value match on an earlier member
+    class Mixed(Enum):
+        A = 1
+        B = '1'
+
+    assert EnumField(Mixed).to_python('1') is Mixed.B
+
+    # A value match wins over a label match on an earlier member
+    class Overlapping(Enum):
+        A = 'x'
+        B = 'y'
+
+        class Labels:
+            A = 'y'
+
+    assert EnumField(Overlapping).to_python('y') is Overlapping.B
+
+
+def test_to_python_lazy_labels():
+    field = EnumField(YesNo, max_length=1)
+    with translation.override('de'):
+        assert field.to_python('Ja') is YesNo.YES
+    with translation.override('en'):
+        assert field.to_python('Yes') is YesNo.YES
+        with pytest.raises(ValidationError):
+            field.to_python('Ja')
+
+
+def test_get_choices():
+    field = EnumField(Color, max_length=1)
+    assert field.get_choices() == [('', '---------'), ('r', 'Reddish'), ('g', 'Green'), ('b', 'bluë')]
+    assert field.get_choices(include_blank=False) == [('r', 'Reddish'), ('g', 'Green'), ('b', 'bluë')]
+    assert field.get_choices(blank_choice=[('', 'None')])[0] == ('', 'None')
+
+    field.choices = [(Color.RED, 'only red')]
+    assert field.get_choices(include_blank=False) == [('r', 'only red')]
+
+    # Members of other enums are mapped to their values too
+    field.choices = [(Taste.SWEET, 'sweet')]
+    assert field.get_choices(include_blank=False) == [(1, 'sweet')]
+
+
+def test_choices_cache_does_not_keep_enums_alive():
+    class Temporary(Enum):
+        A = 'a'
+
+    field = EnumField(Temporary, max_length=1)
+    assert field.choices == [(Temporary.A, 'A')]
+    ref = weakref.ref(Temporary)
+    del Temporary, field
+    gc.collect()
+    assert ref() is None